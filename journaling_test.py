@@ -7,14 +7,83 @@ Tests filesystem data integrity by interrupting file operations and verifying re
 
 import os
 import time
+import math
+import errno
 import shutil
 import hashlib
 import platform
+import struct
 import datetime
 import argparse
+import json
 from pathlib import Path
 import threading
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+class _MD5P8:
+    """
+    MD5P8-style parallel MD5.
+    
+    The stream is dealt round-robin in fixed-size blocks to 8 independent
+    MD5 lanes that are hashed concurrently (hashlib releases the GIL for
+    large updates). The final digest is the MD5 of the 8 lane digests, so
+    the result does not depend on how the caller chunks its reads.
+    """
+    
+    LANES = 8
+    BLOCK_SIZE = 64 * 1024  # 64KB per lane block
+    
+    def __init__(self):
+        self._lanes = [hashlib.md5() for _ in range(self.LANES)]
+        self._position = 0
+        self._executor = ThreadPoolExecutor(max_workers=self.LANES)
+    
+    def update(self, data):
+        """Deal data to the lanes and hash all lanes in parallel"""
+        view = memoryview(data).cast('B')
+        lane_slices = [[] for _ in range(self.LANES)]
+        offset = 0
+        
+        while offset < len(view):
+            block_offset = self._position % self.BLOCK_SIZE
+            lane = (self._position // self.BLOCK_SIZE) % self.LANES
+            size = min(self.BLOCK_SIZE - block_offset, len(view) - offset)
+            lane_slices[lane].append(view[offset:offset + size])
+            offset += size
+            self._position += size
+        
+        futures = [
+            self._executor.submit(self._hash_lane, md5, slices)
+            for md5, slices in zip(self._lanes, lane_slices) if slices
+        ]
+        for future in futures:
+            future.result()
+    
+    @staticmethod
+    def _hash_lane(md5, slices):
+        for chunk in slices:
+            md5.update(chunk)
+    
+    def hexdigest(self):
+        """Combine the lane digests into the final MD5P8 digest"""
+        self._executor.shutdown()
+        combined = hashlib.md5()
+        for md5 in self._lanes:
+            combined.update(md5.digest())
+        return combined.hexdigest()
 
 
 class JournalingRealTest:
@@ -43,6 +112,28 @@ class JournalingRealTest:
         # Add option to control artificial delay
         self.use_delay = True
         
+        # Force copied data to disk every N MB during the copy (0 = only at the end)
+        self.fsync_every_mb = 0
+        
+        # Copy in-kernel with copy_file_range (False = always copy through userspace,
+        # which avoids reflink clones on XFS/Btrfs and keeps filesystems comparable)
+        self.use_kernel_copy = True
+        self.copy_method = None  # Path actually taken by the last copy
+        
+        # Fill the test file with random data (False = only preallocate, much faster)
+        self.require_real_data = True
+        
+        # Always re-hash the source on verify, even if its size and mtime are unchanged
+        self.rehash_source = False
+        
+        # Integrity checksum algorithm (fastest available: BLAKE3, xxh3, parallel MD5)
+        if blake3 is not None:
+            self.checksum_algorithm = "blake3"
+        elif xxhash is not None:
+            self.checksum_algorithm = "xxh3"
+        else:
+            self.checksum_algorithm = "md5p8"
+        
         # Create necessary directories
         self.source_dir = self.test_dir / "source_test"
         self.dest_dir = self.test_dir / "destination_test"
@@ -72,39 +163,74 @@ class JournalingRealTest:
         # File size in bytes
         file_size = int(self.size_gb * 1024 * 1024 * 1024)
         
+        # Fill mode of the finished file ('random' or 'preallocated')
+        fill_marker = self.large_file.with_suffix('.fill')
+        fill_mode = "random" if self.require_real_data else "preallocated"
+        
         # Check if file already exists
-        if self.large_file.exists():
-            current_size = self.large_file.stat().st_size
-            if current_size == file_size:
+        try:
+            current_size = os.stat(self.large_file).st_size
+        except FileNotFoundError:
+            current_size = None
+        if current_size is not None:
+            try:
+                existing_mode = fill_marker.read_text().strip()
+            except FileNotFoundError:
+                existing_mode = None
+            
+            # A random-filled file also serves --no-fill; a preallocated one never serves a filled run
+            if current_size == file_size and existing_mode in (fill_mode, "random"):
                 print(f"File already exists with correct size ({self.size_gb}GB)")
                 return True
-            else:
+            elif current_size != file_size:
                 print(f"File exists with different size. Recreating...")
-                os.remove(self.large_file)
+            else:
+                print(f"File exists but was not created as '{fill_mode}'. Recreating...")
+            os.remove(self.large_file)
+        
+        # Remove a stale marker first so it never describes a partial file
+        fill_marker.unlink(missing_ok=True)
         
-        # Create test file
-        chunk_size = 10 * 1024 * 1024  # 10MB chunks
-        chunk = os.urandom(chunk_size)  # Random data
+        # Create test file under a temporary name, moved into place only when complete
+        chunk_size = 64 * 1024 * 1024  # 64MB per write() call
+        tmp_file = self.large_file.with_name(self.large_file.name + ".tmp")
         
         try:
-            with open(self.large_file, 'wb') as f:
-                remaining = file_size
-                last_progress = -1
+            with open(tmp_file, 'wb') as f:
+                # Reserve all blocks up front (contiguous layout, instant for --no-fill)
+                self._preallocate(f, file_size)
                 
-                while remaining > 0:
-                    write_size = min(chunk_size, remaining)
-                    f.write(chunk[:write_size])
-                    remaining -= write_size
+                if self.require_real_data:
+                    # Random data, generated once and written without slicing copies
+                    chunk = memoryview(os.urandom(min(chunk_size, file_size)))
+                    remaining = file_size
+                    last_progress = -1
                     
-                    # Show progress (only update when changed)
-                    progress = int(100 * (file_size - remaining) / file_size)
-                    if progress != last_progress:
-                        print(f"Progress: {progress}%", end='\r')
-                        last_progress = progress
+                    while remaining > 0:
+                        write_size = min(chunk_size, remaining)
+                        f.write(chunk[:write_size])
+                        remaining -= write_size
+                        
+                        # Show progress (only update when changed)
+                        progress = int(100 * (file_size - remaining) / file_size)
+                        if progress != last_progress:
+                            print(f"Progress: {progress}%", end='\r')
+                            last_progress = progress
+                else:
+                    print("Preallocated without writing data (file reads as zeros)", end='')
                 
                 # Ensure data is written to disk
                 f.flush()
-                os.fsync(f.fileno())
+                self._datasync(f.fileno())
+            
+            os.replace(tmp_file, self.large_file)
+            with open(fill_marker, 'w') as f:
+                f.write(fill_mode)
+                f.flush()
+                self._datasync(f.fileno())
+            
+            # Drop the freshly written pages so the test reads from disk, not cache
+            self._fadvise(self.large_file, 'POSIX_FADV_DONTNEED')
             
             print(f"\nFile created successfully: {self.large_file}")
             return True
@@ -112,37 +238,204 @@ class JournalingRealTest:
         except Exception as e:
             print(f"Error creating file: {str(e)}")
             return False
+        finally:
+            # Never leave a partial file behind (also on Ctrl+C)
+            tmp_file.unlink(missing_ok=True)
+    
+    def _preallocate(self, f, size):
+        """
+        Reserve disk space for a file without writing its data.
+        
+        Uses posix_fallocate where available and F_PREALLOCATE on macOS.
+        The file size is always set, which allocates clusters on NTFS.
+        
+        Args:
+            f (file): File opened for writing
+            size (int): Size to reserve in bytes
+        """
+        fd = f.fileno()
+        try:
+            if hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(fd, 0, size)
+            elif platform.system() == 'Darwin':
+                import fcntl
+                F_PREALLOCATE = 42
+                F_ALLOCATEALL = 0x4
+                F_PEOFPOSMODE = 3
+                # fstore_t: flags, posmode, offset, length, bytesalloc
+                fstore = struct.pack('Iiqqq', F_ALLOCATEALL, F_PEOFPOSMODE, 0, size, 0)
+                fcntl.fcntl(fd, F_PREALLOCATE, fstore)
+        except OSError as e:
+            # Not supported by this filesystem; the data writes will allocate
+            print(f"Preallocation not available ({e.strerror}), continuing...")
+        f.truncate(size)
+    
+    def _datasync(self, fd):
+        """
+        Force file data to disk.
+        
+        Uses fdatasync where available, which skips flushing metadata that
+        is not needed to read the data back (e.g. mtime), and fsync otherwise.
+        
+        Args:
+            fd (int): File descriptor to sync
+        """
+        if hasattr(os, 'fdatasync'):
+            os.fdatasync(fd)
+        else:
+            os.fsync(fd)
     
-    def calculate_checksum(self, file_path):
+    def _fadvise(self, file_path, advice):
         """
-        Calculate MD5 checksum of a file.
+        Give the kernel a page-cache hint for a whole file.
+        
+        Does nothing on platforms without posix_fadvise or if the file
+        cannot be opened.
         
         Args:
             file_path (Path): Path to the file
+            advice (str): Name of the os.POSIX_FADV_* constant to apply
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+    
+    def _read_ahead(self, file_path, chunk_size, depth=4):
+        """
+        Read a file sequentially in a background thread.
+        
+        A reader thread keeps up to `depth` chunks queued so that disk I/O
+        overlaps with whatever the caller does with each chunk, and asks the
+        kernel to prefetch a window of `depth` chunks ahead of the reads. Chunks are
+        read with readinto() into a small pool of reused buffers, so no
+        new object is allocated per read.
+        
+        Args:
+            file_path (Path): Path to the file
+            chunk_size (int): Size of each read in bytes
+            depth (int): Maximum number of chunks buffered ahead
+            
+        Yields:
+            memoryview: File contents in order, one chunk at a time. Each view
+            is only valid until the next chunk is requested.
+        """
+        chunks = queue.Queue(maxsize=depth)
+        free_buffers = queue.Queue()
+        stop = threading.Event()
+        
+        def reader():
+            try:
+                # Unbuffered: each chunk is a single read() straight from the kernel
+                with open(file_path, 'rb', buffering=0) as f:
+                    # Let the kernel read ahead aggressively
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    offset = 0
+                    
+                    while not stop.is_set():
+                        # Prefetch only the next `depth` chunks, so pages are not
+                        # evicted before use on files larger than RAM
+                        if hasattr(os, 'posix_fadvise'):
+                            os.posix_fadvise(f.fileno(), offset, depth * chunk_size,
+                                             os.POSIX_FADV_WILLNEED)
+                        
+                        # Reuse a returned buffer; at most depth + 2 are ever allocated
+                        try:
+                            buf = free_buffers.get_nowait()
+                        except queue.Empty:
+                            buf = bytearray(chunk_size)
+                        n = f.readinto(buf)
+                        if not n:
+                            break
+                        offset += n
+                        chunks.put((buf, n))
+                chunks.put(None)  # End of file
+            except Exception as e:
+                chunks.put(e)
+        
+        reader_thread = threading.Thread(target=reader)
+        reader_thread.daemon = True
+        reader_thread.start()
+        
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is None:
+                    break
+                if isinstance(chunk, Exception):
+                    raise chunk
+                buf, n = chunk
+                yield memoryview(buf)[:n]
+                free_buffers.put(buf)
+        finally:
+            # Unblock the reader if the consumer stopped early
+            stop.set()
+            while not chunks.empty():
+                chunks.get_nowait()
+    
+    def _new_hasher(self, algorithm):
+        """
+        Create a hash object for the given checksum algorithm.
+        
+        Args:
+            algorithm (str): Algorithm name ('blake3', 'xxh3', 'md5p8' or 'md5')
             
         Returns:
-            str: MD5 checksum or None if error
+            object: Hash object with update()/hexdigest() methods
+        """
+        if algorithm == "blake3":
+            if blake3 is None:
+                raise RuntimeError("blake3 module is not installed")
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        if algorithm == "xxh3":
+            if xxhash is None:
+                raise RuntimeError("xxhash module is not installed")
+            return xxhash.xxh3_64()
+        if algorithm == "md5p8":
+            return _MD5P8()
+        if algorithm == "md5":
+            return hashlib.md5()
+        raise ValueError(f"Unknown checksum algorithm: {algorithm}")
+    
+    def calculate_checksum(self, file_path, algorithm=None, show_progress=True):
         """
-        print(f"Calculating checksum for: {file_path}")
+        Calculate integrity checksum of a file.
+        
+        Args:
+            file_path (Path): Path to the file
+            algorithm (str): Checksum algorithm (default: self.checksum_algorithm)
+            show_progress (bool): Print a progress line for large files
+            
+        Returns:
+            str: Checksum tagged with its algorithm ('algo:hex') or None if error
+        """
+        algorithm = algorithm or self.checksum_algorithm
+        print(f"Calculating {algorithm} checksum for: {file_path}")
         try:
-            md5 = hashlib.md5()
+            hasher = self._new_hasher(algorithm)
             file_size = os.path.getsize(file_path)
             processed = 0
             last_progress = -1
             
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096 * 1024), b''):  # 4MB chunks
-                    md5.update(chunk)
-                    processed += len(chunk)
-                    
-                    # Show progress for large files
-                    if file_size > 100 * 1024 * 1024:  # Only for files > 100MB
-                        progress = int(100 * processed / file_size)
-                        if progress != last_progress:
-                            print(f"Checksum progress: {progress}%", end='\r')
-                            last_progress = progress
+            for chunk in self._read_ahead(file_path, 16 * 1024 * 1024):  # 16MB chunks
+                hasher.update(chunk)
+                processed += len(chunk)
+                
+                # Show progress for large files
+                if show_progress and file_size > 100 * 1024 * 1024:  # Only for files > 100MB
+                    progress = int(100 * processed / file_size)
+                    if progress != last_progress:
+                        print(f"Checksum progress: {progress}%", end='\r')
+                        last_progress = progress
             
-            checksum = md5.hexdigest()
+            checksum = f"{algorithm}:{hasher.hexdigest()}"
             print(f"\nChecksum: {checksum}")
             return checksum
         except Exception as e:
@@ -165,13 +458,30 @@ class JournalingRealTest:
             print(f"Destination file already exists. Removing...")
             os.remove(self.dest_file)
         
-        # Save original file checksum
+        # Copy method of a previous run must not be reported for this one
+        copy_method_file = self.source_dir / "copy_method.txt"
+        copy_method_file.unlink(missing_ok=True)
+        
+        # Record the fsync interval of this run for the report written by --verify
+        with open(self.source_dir / "fsync_every_mb.txt", 'w') as f:
+            f.write(str(self.fsync_every_mb))
+            f.flush()
+            self._datasync(f.fileno())
+        
+        # Save original file checksum with the size/mtime it was computed for
         original_checksum = self.calculate_checksum(self.large_file)
+        if original_checksum is None:
+            return False
+        source_stat = os.stat(self.large_file)
         checksum_file = self.source_dir / "original_checksum.txt"
         with open(checksum_file, 'w') as f:
-            f.write(original_checksum)
+            json.dump({
+                "hash": original_checksum,
+                "size": source_stat.st_size,
+                "mtime_ns": source_stat.st_mtime_ns
+            }, f)
             f.flush()
-            os.fsync(f.fileno())
+            self._datasync(f.fileno())
         
         print("\n" + "="*60)
         print(" FILE COPY CRASH TEST ".center(60, "="))
@@ -188,72 +498,142 @@ class JournalingRealTest:
             print("\n⚠ Running at full speed (no artificial delay).")
             print("  Shutdown window will be very short!")
         
+        # Warn if the test file holds no real data
+        fill_marker = self.large_file.with_suffix('.fill')
+        if fill_marker.exists() and fill_marker.read_text().strip() == "preallocated":
+            print("\n⚠ Test file was created with --no-fill and contains only zeros.")
+            print("  A zeroed destination left by a crash will look intact;")
+            print("  recreate the file without --no-fill for a conclusive test.")
+        
         print("\n" + "="*60)
         input("Press Enter when ready to start...")
         
-        # Start copy in separate thread
-        self.copy_thread = threading.Thread(target=self._copy_file_thread)
-        self.copy_thread.daemon = True
-        self.shutdown_prompted = False
-        self.copy_thread.start()
-        
-        # Wait for progress to reach shutdown point
         file_size = os.path.getsize(self.large_file)
+        shutdown_prompted = False
+        shutdown_deadline = None  # End of the shutdown window while it is open
         
-        while self.copy_thread.is_alive():
-            if self.dest_file.exists():
-                try:
-                    copied_size = os.path.getsize(self.dest_file)
-                    progress = 100 * copied_size / file_size
-                    print(f"Progress: {progress:.1f}%", end='\r')
+        try:
+            # Unbuffered so writes go straight to the kernel
+            with open(self.dest_file, 'wb', buffering=0) as dst:
+                copied = 0
+                synced = 0
+                last_progress_shown = -1  # Last displayed progress, in tenths of a percent
+                last_seconds_shown = -1  # Last displayed shutdown countdown, in seconds
+                for chunk_size in self._copy_chunks(dst):
+                    # Record which copy path runs before a crash can interrupt it
+                    if not copied:
+                        with open(copy_method_file, 'w') as f:
+                            f.write(self.copy_method)
+                            f.flush()
+                            self._datasync(f.fileno())
+                    copied += chunk_size
+                    progress = 100 * copied / file_size
+                    
+                    # Optionally force data to disk while copying
+                    if self.fsync_every_mb and copied - synced >= self.fsync_every_mb * 1024 * 1024:
+                        self._datasync(dst.fileno())
+                        synced = copied
                     
                     # When progress is 40-60%, ask user to shutdown
-                    if 40 <= progress <= 60 and not self.shutdown_prompted:
-                        self.shutdown_prompted = True
+                    if 40 <= progress <= 60 and not shutdown_prompted:
+                        shutdown_prompted = True
+                        shutdown_deadline = time.monotonic() + 30
                         print("\n" + "="*60)
                         print(" CRASH POINT REACHED! ".center(60, "="))
                         print("="*60)
                         print("\n⚠️  SHUT DOWN YOUR COMPUTER NOW! ⚠️")
                         print("\n   Hold the power button until computer turns off")
                         print("   OR disconnect the power cable")
-                        print("\n   You have 30 seconds before copy continues...")
+                        print("\n   You have 30 seconds while the copy keeps running...")
                         print("\n" + "="*60 + "\n")
-                        
-                        # Wait for 30 seconds to give user time to shutdown
-                        for i in range(30, 0, -1):
-                            print(f"⚠️  SHUTDOWN NOW! {i} seconds remaining...".ljust(50), end='\r')
-                            time.sleep(1)
-                        
-                        print("\n\nShutdown window passed. Copy continuing...")
-                        
-                except Exception as e:
-                    pass
                     
-            time.sleep(0.5)
+                    # Count down the shutdown window while the copy keeps running
+                    if shutdown_deadline is not None:
+                        seconds_left = math.ceil(shutdown_deadline - time.monotonic())
+                        if seconds_left <= 0:
+                            shutdown_deadline = None
+                            print("\n\nShutdown window passed. Copy continuing...")
+                        elif seconds_left != last_seconds_shown:
+                            print(f"⚠️  SHUTDOWN NOW! {seconds_left} seconds remaining...".ljust(50), end='\r')
+                            last_seconds_shown = seconds_left
+                    else:
+                        # Show progress (only update when the displayed value changes)
+                        shown = int(progress * 10)
+                        if shown != last_progress_shown:
+                            print(f"Progress: {shown / 10:.1f}%", end='\r')
+                            last_progress_shown = shown
+                    
+                    # Add deliberate slowdown only if requested
+                    if self.use_delay:
+                        time.sleep(0.2)  # 200ms delay per MB
+                
+                # Keep the shutdown window open for its full 30 seconds if the copy finished
+                # first, and only sync afterwards so a crash can still catch unflushed data
+                if shutdown_deadline is not None:
+                    while time.monotonic() < shutdown_deadline:
+                        seconds_left = math.ceil(shutdown_deadline - time.monotonic())
+                        print(f"⚠️  SHUTDOWN NOW! {seconds_left} seconds remaining...".ljust(50), end='\r')
+                        time.sleep(1)
+                    print("\n\nShutdown window passed.")
+                
+                # Ensure data is written to disk
+                self._datasync(dst.fileno())
+                
+        except Exception as e:
+            print(f"\nError during copy: {str(e)}")
+            return False
         
         print("\n\nFile copy completed.")
         print("If you shut down during the crash window, reboot and run:")
         print(f"  python {sys.argv[0]} --type {self.fs_type} --size {self.size_gb} --verify")
         return True
     
-    def _copy_file_thread(self):
-        """Thread for file copying with optional deliberate slowdown"""
-        try:
+    def _copy_chunks(self, dst):
+        """
+        Copy the source file into dst, yielding the size of each chunk copied.
+        
+        Uses in-kernel os.copy_file_range where available and enabled (no
+        userspace buffers, reflinks on filesystems that support them) and
+        falls back to a pipelined read/write loop otherwise. The path taken
+        is stored in self.copy_method before the first chunk is yielded.
+        
+        Args:
+            dst (file): Destination file opened unbuffered for writing
+            
+        Yields:
+            int: Number of bytes copied by each step
+        """
+        # 1MB steps keep the artificial delay per MB, otherwise copy 64MB per call
+        chunk_size = 1024 * 1024 if self.use_delay else 64 * 1024 * 1024
+        # Never copy past the next --fsync-every boundary in one call
+        if self.fsync_every_mb:
+            chunk_size = min(chunk_size, self.fsync_every_mb * 1024 * 1024)
+        
+        if self.use_kernel_copy and hasattr(os, 'copy_file_range'):
+            self.copy_method = "copy_file_range"
             with open(self.large_file, 'rb') as src:
-                with open(self.dest_file, 'wb') as dst:
-                    while True:
-                        buf = src.read(1024 * 1024)  # Read 1MB at a time
-                        if not buf:
-                            break
-                        dst.write(buf)
-                        dst.flush()  # Ensure write to disk
-                        
-                        # Add deliberate slowdown only if requested
-                        if self.use_delay:
-                            time.sleep(0.2)  # 200ms delay per MB
-                        
-        except Exception as e:
-            print(f"\nError during copy: {str(e)}")
+                offset = 0
+                while True:
+                    try:
+                        copied = os.copy_file_range(src.fileno(), dst.fileno(),
+                                                    chunk_size, offset, offset)
+                    except OSError as e:
+                        unsupported = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP)
+                        if offset == 0 and e.errno in unsupported:
+                            break  # Fall back to read/write below
+                        raise
+                    if not copied:
+                        return
+                    offset += copied
+                    yield copied
+        
+        # Keep up to 16 reads in flight ahead of the writes
+        self.copy_method = "read/write"
+        for buf in self._read_ahead(self.large_file, 1024 * 1024, depth=16):  # 1MB at a time
+            view = memoryview(buf)
+            while view:
+                view = view[dst.write(view):]
+            yield len(buf)
     
     def verify_after_crash(self):
         """
@@ -290,41 +670,110 @@ class JournalingRealTest:
             print("❌ Checksum file not found. Must run --create and --test first.")
             return False
         
-        # Read original checksum
+        # Read original checksum (plain-text files predate the JSON format,
+        # untagged checksums predate algorithm tags and are MD5)
         with open(checksum_file, 'r') as f:
-            original_checksum = f.read().strip()
+            content = f.read().strip()
+        try:
+            checksum_info = json.loads(content)
+        except ValueError:
+            checksum_info = None
+        if not isinstance(checksum_info, dict):
+            checksum_info = {"hash": content}
+        original_checksum = checksum_info["hash"]
+        if ':' not in original_checksum:
+            original_checksum = f"md5:{original_checksum}"
+        algorithm = original_checksum.split(':', 1)[0]
+        try:
+            self._new_hasher(algorithm)
+        except (RuntimeError, ValueError) as e:
+            print(f"❌ Cannot verify {algorithm} checksum: {e}")
+            return False
         
         results = {
             "source_exists": self.large_file.exists(),
             "destination_exists": self.dest_file.exists(),
             "source_intact": False,
-            "destination_intact": False
+            "destination_intact": False,
+            "source_verified_by": None,  # 'hash' or 'metadata' (size/mtime only)
+            "copy_method": "unknown",
+            "fsync_every_mb": None,  # Interval used by --test, None if not recorded
+            "fill_mode": "unknown"  # 'random' or 'preallocated' (all zeros)
         }
         
+        # Copy path recorded by --test ('copy_file_range' or 'read/write')
+        copy_method_file = self.source_dir / "copy_method.txt"
+        if copy_method_file.exists():
+            results["copy_method"] = copy_method_file.read_text().strip()
+        
+        # Test file contents recorded by --create
+        fill_marker = self.large_file.with_suffix('.fill')
+        if fill_marker.exists():
+            results["fill_mode"] = fill_marker.read_text().strip()
+        
+        # Fsync interval recorded by --test (0 = only at the end)
+        fsync_every_file = self.source_dir / "fsync_every_mb.txt"
+        if fsync_every_file.exists():
+            results["fsync_every_mb"] = int(fsync_every_file.read_text().strip())
+        
+        # Skip the source hash if it is unchanged since the checksum was recorded
+        source_cached = False
+        if results["source_exists"] and not self.rehash_source:
+            source_stat = os.stat(self.large_file)
+            source_cached = (source_stat.st_size == checksum_info.get("size") and
+                             source_stat.st_mtime_ns == checksum_info.get("mtime_ns"))
+        
+        # Hash source and destination concurrently (hashing releases the GIL)
+        hash_source = results["source_exists"] and not source_cached
+        # A destination whose size differs from the source cannot be intact
+        expected_size = checksum_info.get("size")
+        if expected_size is None and results["source_exists"]:
+            expected_size = os.path.getsize(self.large_file)
+        hash_dest = results["destination_exists"] and (
+            expected_size is None or os.path.getsize(self.dest_file) == expected_size)
+        show_progress = not (hash_source and hash_dest)  # Progress lines would overwrite each other
+        
+        print("Checking file integrity...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if hash_source:
+                source_future = executor.submit(self.calculate_checksum, self.large_file,
+                                                algorithm, show_progress)
+            if hash_dest:
+                dest_future = executor.submit(self.calculate_checksum, self.dest_file,
+                                              algorithm, show_progress)
+        
         # Check source file integrity
         if results["source_exists"]:
-            print("Checking source file integrity...")
-            current_checksum = self.calculate_checksum(self.large_file)
-            results["source_intact"] = (current_checksum == original_checksum)
+            print("\nChecking source file integrity...")
+            if source_cached:
+                results["source_verified_by"] = "metadata"
+                results["source_intact"] = True
+            else:
+                results["source_verified_by"] = "hash"
+                results["source_intact"] = (source_future.result() == original_checksum)
             
-            if results["source_intact"]:
+            if results["source_verified_by"] == "metadata":
+                print("✓ Source size and modification time unchanged (not re-hashed).")
+            elif results["source_intact"]:
                 print("✓ Source file is completely intact!")
             else:
                 print("✗ Source file exists but is corrupted!")
         else:
-            print("✗ Source file does not exist!")
+            print("\n✗ Source file does not exist!")
         
         # Check destination file existence and integrity
         if results["destination_exists"]:
             print("\nChecking destination file integrity...")
-            dest_checksum = self.calculate_checksum(self.dest_file)
-            results["destination_intact"] = (dest_checksum == original_checksum)
+            if hash_dest:
+                results["destination_intact"] = (dest_future.result() == original_checksum)
+            else:
+                print("Destination size differs from source, checksum skipped.")
             
             if results["destination_intact"]:
                 print("✓ Destination file is completely intact!")
             else:
                 dest_size = os.path.getsize(self.dest_file)
-                source_size = os.path.getsize(self.large_file) if self.large_file.exists() else 0
+                source_size = os.path.getsize(self.large_file) if results["source_exists"] else 0
                 print(f"✗ Destination file exists but is incomplete or corrupted!")
                 print(f"  Destination size: {dest_size:,} bytes")
                 if source_size > 0:
@@ -335,6 +784,17 @@ class JournalingRealTest:
         
         # Determine journaling status
         journaling_status = self.evaluate_journaling_status(results)
+        if results["source_verified_by"] == "metadata":
+            journaling_status["description"] += (
+                " Source integrity was inferred from unchanged size and mtime, not re-hashed"
+                " (use --rehash-source to verify it).")
+        if results["fill_mode"] == "preallocated" and results["destination_intact"]:
+            journaling_status = {
+                "status": "INCONCLUSIVE",
+                "description": "Destination matches the source, but the test file contains only zeros"
+                               " (--no-fill), so a zeroed destination left by the crash would match too."
+                               " Recreate the file without --no-fill and repeat the test."
+            }
         
         # Display assessment
         print("\n" + "="*60)
@@ -402,29 +862,54 @@ class JournalingRealTest:
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         result_file = self.results_dir / f"{self.fs_type}_real_journaling_{timestamp}.txt"
         
+        fsync_every = results["fsync_every_mb"]
+        if fsync_every is None:
+            fsync_every = "unknown"
+        elif fsync_every == 0:
+            fsync_every = "end only"
+        
+        fill_contents = {
+            "random": "random data",
+            "preallocated": "preallocated (zeros)"
+        }.get(results["fill_mode"], results["fill_mode"])
+        
+        lines = [
+            "Real-world Journaling Test Results",
+            f"{'='*60}",
+            "",
+            f"Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"OS: {platform.system()} {platform.release()}",
+            f"Filesystem: {self.fs_type}",
+            f"Test file size: {self.size_gb}GB",
+            f"Artificial delay used: {self.use_delay}",
+            f"Fsync every MB during copy: {fsync_every}",
+            f"Copy method: {results['copy_method']}",
+            f"Test file contents: {fill_contents}",
+            "",
+            "Test Results:",
+            f"- Source file exists: {results['source_exists']}",
+            f"- Source file intact: {results['source_intact']}",
+            f"- Source integrity checked by: {results['source_verified_by'] or 'n/a'}",
+            f"- Destination file exists: {results['destination_exists']}",
+            f"- Destination file intact: {results['destination_intact']}",
+            "",
+            f"Journaling Assessment: {journaling_status['status']}",
+            f"{journaling_status['description']}",
+            "",
+            "Summary:",
+        ]
+        if journaling_status['status'] in ["EXCELLENT", "GOOD"]:
+            lines.append(f"{self.fs_type} has effective journaling.")
+        elif journaling_status['status'] == "INCONCLUSIVE":
+            lines.append(f"No conclusion about {self.fs_type} journaling from this run.")
+        else:
+            lines.append(f"{self.fs_type} has limited or ineffective journaling.")
+        
+        # Single write and sync so the report survives a later crash
         with open(result_file, 'w') as f:
-            f.write(f"Real-world Journaling Test Results\n")
-            f.write(f"{'='*60}\n\n")
-            f.write(f"Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"OS: {platform.system()} {platform.release()}\n")
-            f.write(f"Filesystem: {self.fs_type}\n")
-            f.write(f"Test file size: {self.size_gb}GB\n")
-            f.write(f"Artificial delay used: {self.use_delay}\n\n")
-            
-            f.write("Test Results:\n")
-            f.write(f"- Source file exists: {results['source_exists']}\n")
-            f.write(f"- Source file intact: {results['source_intact']}\n")
-            f.write(f"- Destination file exists: {results['destination_exists']}\n")
-            f.write(f"- Destination file intact: {results['destination_intact']}\n\n")
-            
-            f.write(f"Journaling Assessment: {journaling_status['status']}\n")
-            f.write(f"{journaling_status['description']}\n\n")
-            
-            f.write("Summary:\n")
-            if journaling_status['status'] in ["EXCELLENT", "GOOD"]:
-                f.write(f"{self.fs_type} has effective journaling.\n")
-            else:
-                f.write(f"{self.fs_type} has limited or ineffective journaling.\n")
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            self._datasync(f.fileno())
         
         print(f"\n✓ Results saved to: {result_file}")
         return result_file
@@ -440,14 +925,26 @@ Examples:
   # Create a 2GB test file for NTFS
   python journaling_test.py --type NTFS --size 2 --create
   
+  # Create the test file instantly by preallocating it (contents read as zeros)
+  python journaling_test.py --type NTFS --size 2 --create --no-fill
+  
   # Run the crash test
   python journaling_test.py --type NTFS --size 2 --test
   
   # Verify results after reboot
   python journaling_test.py --type NTFS --size 2 --verify
   
+  # Copy through userspace read/write (no in-kernel copy or reflink clones)
+  python journaling_test.py --type XFS --size 2 --test --no-kernel-copy
+  
+  # Verify and re-hash the source even if its size and mtime are unchanged
+  python journaling_test.py --type NTFS --size 2 --verify --rehash-source
+  
   # Run test at full speed (harder to time shutdown)
   python journaling_test.py --type NTFS --size 2 --test --no-delay
+  
+  # Force copied data to disk every 64MB during the copy
+  python journaling_test.py --type NTFS --size 2 --test --fsync-every 64
         """
     )
     
@@ -457,12 +954,20 @@ Examples:
                        help='File size in GB (default: 2)')
     parser.add_argument('--create', action='store_true', 
                        help='Create large test file')
+    parser.add_argument('--no-fill', action='store_true',
+                       help='Only preallocate the test file (zeros); intact copies are reported as inconclusive')
     parser.add_argument('--test', action='store_true', 
                        help='Start copy test (will prompt for crash)')
     parser.add_argument('--verify', action='store_true', 
                        help='Verify results after crash')
+    parser.add_argument('--rehash-source', action='store_true',
+                       help='Re-hash the source on verify even if its size and mtime are unchanged')
     parser.add_argument('--no-delay', action='store_true', 
                        help='Run copy at normal speed without artificial slowdown')
+    parser.add_argument('--no-kernel-copy', action='store_true',
+                       help='Copy through userspace read/write instead of copy_file_range')
+    parser.add_argument('--fsync-every', type=int, default=0, metavar='MB',
+                       help='Fsync destination every MB megabytes during copy (default: only at end)')
     
     args = parser.parse_args()
     
@@ -470,6 +975,9 @@ Examples:
     if args.size < 1:
         print("Error: File size must be at least 1GB")
         sys.exit(1)
+    if args.fsync_every < 0:
+        print("Error: --fsync-every must not be negative")
+        sys.exit(1)
     
     tester = JournalingRealTest(args.type, args.size)
     
@@ -477,6 +985,21 @@ Examples:
     if args.no_delay:
         tester.use_delay = False
     
+    # Set file fill option
+    if args.no_fill:
+        tester.require_real_data = False
+    
+    # Set source verification option
+    if args.rehash_source:
+        tester.rehash_source = True
+    
+    # Set copy path option
+    if args.no_kernel_copy:
+        tester.use_kernel_copy = False
+    
+    # Set fsync interval
+    tester.fsync_every_mb = args.fsync_every
+    
     # Execute requested actions
     if args.create:
         success = tester.create_large_file()